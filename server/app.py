@@ -1,22 +1,35 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import asyncio
 import re
 import os
 import json
+import orjson
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import hashlib
+import time
 import uuid
 
 # NLTK setup
 import nltk
 from nltk.corpus import wordnet as wn
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 
-# Wikipedia API
-import wikipedia
+# Wikipedia API (MediaWiki endpoints, fetched concurrently)
+import aiohttp
+
+# Optional: streaming SGML parsing for large AQUAINT files
+try:
+    from lxml import etree
+except Exception:
+    etree = None
+
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
 
 app = FastAPI(title="WSD Backend API")
 
@@ -102,63 +115,171 @@ def _ensure_nltk_data() -> None:
                 pass
 
 
-def _normalize_tokens(text: str) -> List[str]:
-    """Lowercase, tokenize, remove non-alphabetic tokens and stopwords."""
-    try:
-        tokens = [t.lower() for t in word_tokenize(text)]
-    except LookupError:
-        tokens = re.findall(r"[a-z]+", text.lower())
-    tokens = [re.sub(r"[^a-z]", "", t) for t in tokens]
-    tokens = [t for t in tokens if t]
+_ALPHA_RE = re.compile(r"[a-z]+")
+
+# Populated by _load_stopwords(); empty only while the corpus is absent.
+_STOPWORDS: frozenset = frozenset()
+
+
+# Sentences and glosses repeat heavily across an AQUAINT batch; cache
+# normalization for short inputs only so whole documents never pin memory.
+_NORMALIZE_CACHE_MAX_LEN = 1024
+
+
+@lru_cache(maxsize=1 << 16)
+def _normalize_tokens_cached(text: str) -> Tuple[str, ...]:
+    return tuple(t for m in _ALPHA_RE.finditer(text.lower()) if (t := m.group()) not in _STOPWORDS)
+
+
+def _normalize_tokens(text: str) -> Tuple[str, ...]:
+    """Lowercase, extract alphabetic tokens, and drop stopwords.
+
+    Downstream only ever consumes [a-z]+ tokens, so a single regex pass
+    replaces the much slower Punkt/Treebank tokenization. finditer keeps
+    this to one output allocation: no intermediate token list is built.
+    """
+    if len(text) <= _NORMALIZE_CACHE_MAX_LEN:
+        return _normalize_tokens_cached(text)
+    return tuple(t for m in _ALPHA_RE.finditer(text.lower()) if (t := m.group()) not in _STOPWORDS)
+
+
+def _load_stopwords() -> None:
+    """(Re)load the stopword set once the corpus is available.
+
+    Called at import for installs that already have the corpus and again
+    from the startup hook after _ensure_nltk_data() has had a chance to
+    download it. When the set changes, cached normalizations are dropped
+    so tuples tokenized against the empty set cannot linger.
+    """
+    global _STOPWORDS
     try:
-        stops = set(stopwords.words("english"))
+        loaded = frozenset(stopwords.words("english"))
     except LookupError:
-        stops = set()
-    return [t for t in tokens if t not in stops]
+        return
+    if loaded != _STOPWORDS:
+        _STOPWORDS = loaded
+        _normalize_tokens_cached.cache_clear()
+
+
+_load_stopwords()
+
+
+def _context_set(sentence: str, target_l: str) -> frozenset:
+    """Normalized context tokens of a sentence, minus the target itself."""
+    return frozenset(t for t in _normalize_tokens(sentence) if t != target_l)
+
+
+@lru_cache(maxsize=100_000)
+def _gloss_token_set(synset_name: str) -> frozenset:
+    """Normalized token-set of a synset's gloss (definition + examples).
+
+    Glosses are immutable, so this is cached for the process lifetime.
+    """
+    ss = wn.synset(synset_name)
+    gloss_text = ss.definition() + " " + " ".join(ss.examples())
+    return frozenset(_normalize_tokens(gloss_text))
 
 
 def compute_lesk_wordnet(sentence: str, target: str, pos: Optional[str] = None) -> Dict[str, Any]:
     """Simplified Lesk using WordNet (definition + examples)."""
     target_l = target.lower()
-    ctx_tokens = _normalize_tokens(sentence)
-    ctx_tokens = [t for t in ctx_tokens if t != target_l]
-    context = set(ctx_tokens)
+    context = _context_set(sentence, target_l)
 
     pos_map = {"n": wn.NOUN, "v": wn.VERB, "a": wn.ADJ, "r": wn.ADV}
     wn_pos = pos_map.get(pos.lower(), None) if pos else None
 
     synsets = wn.synsets(target, pos=wn_pos) if wn_pos else wn.synsets(target)
-    candidates: List[LeskSense] = []
 
+    # Score with raw intersections first; sorting is only needed when the
+    # overlaps are serialized into the response.
+    scored = []
     for ss in synsets:
-        gloss_text = ss.definition() + " " + " ".join(ss.examples())
-        gloss_tokens = _normalize_tokens(gloss_text)
-        gloss_tokens = [t for t in gloss_tokens if t != target_l]
-        overlaps = sorted(context.intersection(set(gloss_tokens)))
-        candidates.append(
-            LeskSense(
-                synset=ss.name(),
-                definition=ss.definition(),
-                examples=list(ss.examples()),
-                lemma_names=list(ss.lemma_names()),
-                overlap_count=len(overlaps),
-                overlaps=overlaps,
-            )
-        )
+        overlap = context & _gloss_token_set(ss.name())
+        scored.append((ss, overlap))
+
+    # Plain dicts: the response model validates once in the handler
+    # instead of round-tripping each candidate through pydantic.
+    candidates: List[Dict[str, Any]] = [
+        {
+            "synset": ss.name(),
+            "definition": ss.definition(),
+            "examples": list(ss.examples()),
+            "lemma_names": list(ss.lemma_names()),
+            "overlap_count": len(overlap),
+            "overlaps": sorted(overlap),
+        }
+        for ss, overlap in scored
+    ]
 
     best = None
     if candidates:
-        best = max(candidates, key=lambda c: (c.overlap_count, len(c.examples)))
+        best = max(candidates, key=lambda c: (c["overlap_count"], len(c["examples"])))
+
+    return {"candidates": candidates, "best_sense": best}
+
+
+WIKI_CACHE_DIR = DATA_DIR / "wiki_cache"
+WIKI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+_WIKI_EXTRACT_TTL = 7 * 24 * 3600  # summaries change rarely
+_WIKI_SEARCH_TTL = 24 * 3600       # search rankings drift faster
+
+
+def _wiki_cache_path(kind: str, key: str) -> Path:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return WIKI_CACHE_DIR / f"{kind}-{digest}.json"
+
+
+def _wiki_cache_get(kind: str, key: str, ttl: int) -> Optional[Any]:
+    path = _wiki_cache_path(kind, key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if time.time() - entry.get("fetched_at", 0) <= ttl:
+            return entry.get("value")
+    except Exception:
+        pass
+    return None
+
+
+def _wiki_cache_put(kind: str, key: str, value: Any) -> None:
+    path = _wiki_cache_path(kind, key)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "value": value}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        pass
 
-    return {
-        "candidates": [c.model_dump() for c in candidates],
-        "best_sense": best.model_dump() if best else None,
-    }
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Shared session with keep-alive pooling for all Wikipedia calls.
+
+    Reusing connections keeps TCP/TLS handshakes out of the hot path; the
+    DNS cache avoids re-resolving wikipedia.org on every batch.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+        )
+    return _http_session
 
 
 @app.on_event("startup")
 async def _startup_event():
     _ensure_nltk_data()
+    _load_stopwords()
+    app.state.http = _get_http_session()
+
+
+@app.on_event("shutdown")
+async def _shutdown_event():
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
 
 
 @app.post("/api/lesk/wordnet", response_model=LeskResponse)
@@ -167,75 +288,141 @@ async def lesk_wordnet(req: LeskRequest):
         raise HTTPException(status_code=400, detail="Both 'sentence' and 'target' are required.")
 
     result = compute_lesk_wordnet(req.sentence, req.target, req.pos)
-    return LeskResponse(
-        target=req.target,
-        sentence=req.sentence,
-        best_sense=result["best_sense"],
-        candidates=[LeskSense(**c) for c in result["candidates"]],
+    return LeskResponse.model_validate(
+        {
+            "target": req.target,
+            "sentence": req.sentence,
+            "best_sense": result["best_sense"],
+            "candidates": result["candidates"],
+        }
     )
 
 
-def lesk_wikipedia(sentence: str, target: str, max_candidates: int = 15) -> Dict[str, Any]:
-    """Lesk using Wikipedia summaries from disambiguation options."""
-    target_l = target.lower()
-    ctx_tokens = _normalize_tokens(sentence)
-    ctx_tokens = [t for t in ctx_tokens if t != target_l]
-    context = set(ctx_tokens)
+async def _search_wiki_titles(session: aiohttp.ClientSession, target: str, limit: int) -> List[str]:
+    """Search candidate article titles via the MediaWiki search API."""
+    cache_key = f"{target.lower()}|{limit}"
+    cached = _wiki_cache_get("search", cache_key, _WIKI_SEARCH_TTL)
+    if cached is not None:
+        return list(cached)
 
-    titles: List[str] = []
+    params = {
+        "action": "query",
+        "list": "search",
+        "srsearch": target,
+        "srlimit": limit,
+        "format": "json",
+    }
     try:
-        _ = wikipedia.page(target, auto_suggest=False, redirect=True, preload=False)
-        titles = wikipedia.search(target)[:max_candidates]
-    except wikipedia.DisambiguationError as e:
-        titles = e.options[:max_candidates]
-    except wikipedia.PageError:
-        titles = wikipedia.search(target)[:max_candidates]
+        async with session.get(WIKI_API_URL, params=params) as resp:
+            data = await resp.json()
     except Exception:
-        titles = wikipedia.search(target)[:max_candidates]
+        return []
+    query = data.get("query")
+    if query is None:
+        # Error/maxlag body with HTTP 200; don't cache a transient failure.
+        return []
+    titles = [hit["title"] for hit in query.get("search", [])]
+    _wiki_cache_put("search", cache_key, titles)
+    return titles
 
-    candidates: List[WikiSense] = []
 
+async def _fetch_wiki_extracts(session: aiohttp.ClientSession, titles: List[str]) -> List[Tuple[str, str, Optional[str]]]:
+    """Fetch intro extracts + URLs for up to 50 titles in one API round-trip.
+
+    Returns (title, summary, url) tuples in the order of `titles`.
+    """
+    if not titles:
+        return []
+    cache_key = "|".join(t.lower() for t in titles)
+    cached = _wiki_cache_get("extracts", cache_key, _WIKI_EXTRACT_TTL)
+    if cached is not None:
+        return [tuple(item) for item in cached]
+
+    params = {
+        "action": "query",
+        "format": "json",
+        "prop": "extracts|info",
+        "exintro": 1,
+        "explaintext": 1,
+        "inprop": "url",
+        "redirects": 1,
+        "titles": "|".join(titles),
+    }
+    try:
+        async with session.get(WIKI_API_URL, params=params) as resp:
+            data = await resp.json()
+    except Exception:
+        return []
+
+    query = data.get("query")
+    if query is None:
+        # Error/maxlag body with HTTP 200; don't cache a transient failure.
+        return []
+    # Map the requested titles through any server-side normalization/redirects.
+    renames: Dict[str, str] = {}
+    for mapping in query.get("normalized", []) + query.get("redirects", []):
+        renames[mapping.get("from", "")] = mapping.get("to", "")
+
+    by_title: Dict[str, Tuple[str, Optional[str]]] = {}
+    for page in query.get("pages", {}).values():
+        extract = page.get("extract") or ""
+        if extract:
+            by_title[page.get("title", "")] = (extract, page.get("fullurl"))
+
+    out: List[Tuple[str, str, Optional[str]]] = []
     for title in titles:
-        try:
-            summary = wikipedia.summary(title, sentences=3, auto_suggest=False, redirect=True)
-        except wikipedia.DisambiguationError:
-            try:
-                summary = wikipedia.summary(title + " (disambiguation)", sentences=2)
-            except Exception:
-                continue
-        except Exception:
-            continue
+        resolved = title
+        for _ in range(3):  # normalization then redirect, at most
+            if resolved not in renames:
+                break
+            resolved = renames[resolved]
+        if resolved in by_title:
+            extract, url = by_title[resolved]
+            out.append((title, extract, url))
+    _wiki_cache_put("extracts", cache_key, out)
+    return out
 
-        gloss_tokens = _normalize_tokens(summary)
-        gloss_tokens = [t for t in gloss_tokens if t != target_l]
-        overlaps = sorted(context.intersection(set(gloss_tokens)))
 
-        url = None
-        if len(candidates) < 5 and len(overlaps) > 0:
-            try:
-                page = wikipedia.page(title, auto_suggest=False, redirect=True, preload=False)
-                url = page.url
-            except Exception:
-                url = None
+async def _fetch_wiki_candidates(target: str, max_candidates: int = 15) -> List[Tuple[str, str, Optional[str]]]:
+    """Resolve candidate (title, summary, url) tuples for a target word."""
+    session = _get_http_session()
+    titles = await _search_wiki_titles(session, target, max_candidates)
+    return await _fetch_wiki_extracts(session, titles)
+
+
+def _score_wiki_candidates(sentence: str, target: str, fetched: List[Tuple[str, str, Optional[str]]]) -> Dict[str, Any]:
+    """Score prefetched Wikipedia candidates against a sentence context."""
+    target_l = target.lower()
+    context = _context_set(sentence, target_l)
+
+    candidates: List[Dict[str, Any]] = []
+    for title, summary, url in fetched:
+        # set.intersection consumes the token list directly; no need to
+        # build an intermediate set (the target never survives anyway
+        # since the context excludes it).
+        overlaps = sorted(context.intersection(_normalize_tokens(summary)))
 
         candidates.append(
-            WikiSense(
-                title=title,
-                summary=summary,
-                url=url,
-                overlap_count=len(overlaps),
-                overlaps=overlaps,
-            )
+            {
+                "title": title,
+                "summary": summary,
+                "url": url,
+                "overlap_count": len(overlaps),
+                "overlaps": overlaps,
+            }
         )
 
     best = None
     if candidates:
-        best = max(candidates, key=lambda c: (c.overlap_count, len(c.summary)))
+        best = max(candidates, key=lambda c: (c["overlap_count"], len(c["summary"])))
+
+    return {"candidates": candidates, "best_sense": best}
 
-    return {
-        "candidates": [c.model_dump() for c in candidates],
-        "best_sense": best.model_dump() if best else None,
-    }
+
+async def lesk_wikipedia(sentence: str, target: str, max_candidates: int = 15) -> Dict[str, Any]:
+    """Lesk using Wikipedia summaries, fetched concurrently for all candidates."""
+    fetched = await _fetch_wiki_candidates(target, max_candidates)
+    return _score_wiki_candidates(sentence, target, fetched)
 
 
 @app.post("/api/lesk/wiki", response_model=WikiResponse)
@@ -243,12 +430,14 @@ async def lesk_wiki(req: LeskRequest):
     if not req.sentence or not req.target:
         raise HTTPException(status_code=400, detail="Both 'sentence' and 'target' are required.")
 
-    result = lesk_wikipedia(req.sentence, req.target)
-    return WikiResponse(
-        target=req.target,
-        sentence=req.sentence,
-        best_sense=result["best_sense"],
-        candidates=[WikiSense(**c) for c in result["candidates"]],
+    result = await lesk_wikipedia(req.sentence, req.target)
+    return WikiResponse.model_validate(
+        {
+            "target": req.target,
+            "sentence": req.sentence,
+            "best_sense": result["best_sense"],
+            "candidates": result["candidates"],
+        }
     )
 
 
@@ -291,6 +480,47 @@ def _extract_sentences(text: str) -> List[str]:
         return re.split(r"(?<=[.!?])\s+", text)
 
 
+def _find_target_sentence(text: str, tgt_l: str) -> Optional[str]:
+    """Return the first sentence containing the target word.
+
+    Scans for the target with str.find and only sentence-tokenizes the
+    neighbourhood of the hit, instead of materializing every sentence of
+    the document. Falls back to a full tokenization if the local span
+    does not yield a match.
+    """
+    lower = text.lower()
+    start = 0
+    n = len(lower)
+    while True:
+        idx = lower.find(tgt_l, start)
+        if idx < 0:
+            return None
+        # Word-boundary check to skip substring hits like "cart" for "car".
+        end = idx + len(tgt_l)
+        if (idx > 0 and lower[idx - 1].isalpha()) or (end < n and lower[end].isalpha()):
+            start = idx + 1
+            continue
+
+        span_start = max(lower.rfind(".", 0, idx), lower.rfind("!", 0, idx),
+                         lower.rfind("?", 0, idx), lower.rfind("\n", 0, idx)) + 1
+        span_end = n
+        for mark in (".", "!", "?", "\n"):
+            pos = lower.find(mark, end)
+            if pos >= 0:
+                span_end = min(span_end, pos + 1)
+        snippet = text[span_start:span_end]
+
+        for s in _extract_sentences(snippet):
+            if tgt_l in s.lower():
+                return s.strip()
+
+        # Heuristic span was ambiguous (e.g. abbreviations); tokenize fully.
+        for s in _extract_sentences(text):
+            if tgt_l in s.lower():
+                return s.strip()
+        return None
+
+
 def _read_text_file(path: Path) -> str:
     try:
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
@@ -299,60 +529,132 @@ def _read_text_file(path: Path) -> str:
         return ""
 
 
-def _run_aquaint_batch(target: str, limit: int, method: str) -> Dict[str, Any]:
-    processed = 0
-    found = 0
-    results: List[Dict[str, Any]] = []
+_SGML_SUFFIXES = {".sgm", ".sgml", ".xml"}
+
+
+def _iter_text_blocks(path: Path):
+    """Yield text blocks from an AQUAINT file.
+
+    SGML/XML documents are stream-parsed with lxml, yielding one <TEXT>
+    block at a time and freeing each element afterwards, so non-matching
+    files never decode fully into memory. Plain .txt files (and parse
+    failures) fall back to a single whole-file read.
+    """
+    if etree is not None and path.suffix.lower() in _SGML_SUFFIXES:
+        yielded = False
+        try:
+            for _event, elem in etree.iterparse(
+                str(path), events=("end",), tag="TEXT", recover=True
+            ):
+                yielded = True
+                yield "".join(elem.itertext())
+                elem.clear()
+            if yielded:
+                return
+        except Exception:
+            if yielded:
+                return
+    text = _read_text_file(path)
+    if text:
+        yield text
+
+
+def _find_target_in_file(path: Path, tgt_l: str) -> Optional[str]:
+    """First sentence containing the target across the file's text blocks."""
+    for block in _iter_text_blocks(path):
+        sent = _find_target_sentence(block, tgt_l)
+        if sent:
+            return sent
+    return None
+
+
+_AQUAINT_CONCURRENCY = 16
+
+# The WordNet path is CPU-bound (tokenization + synset lookups); a process
+# pool sidesteps the GIL. Created lazily so workers only spawn when a
+# wordnet batch actually runs. Gloss token-sets are cached per worker via
+# _gloss_token_set's lru_cache.
+_wn_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_wn_pool() -> ProcessPoolExecutor:
+    global _wn_pool
+    if _wn_pool is None:
+        _wn_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _wn_pool
+
+
+def _process_file_wordnet(path_str: str, target: str) -> Dict[str, Any]:
+    """Worker-side: read one AQUAINT file and run WordNet Lesk on it."""
+    sent = _find_target_in_file(Path(path_str), target.lower())
+    if not sent:
+        return {"file": path_str, "sentence": None, "best": None, "candidates_count": 0}
+    out = compute_lesk_wordnet(sent, target)
+    return {
+        "file": path_str,
+        "sentence": sent,
+        "best": out.get("best_sense"),
+        "candidates_count": len(out.get("candidates", [])),
+    }
+
 
+async def _run_aquaint_batch(target: str, limit: int, method: str) -> Dict[str, Any]:
     tgt_l = target.lower()
+    files: List[Path] = []
     for fp in _iter_aquaint_files(AQUAINT_DIR):
-        if processed >= limit:
+        if len(files) >= limit:
             break
-        processed += 1
-        text = _read_text_file(fp)
-        if not text:
-            results.append({"file": str(fp), "sentence": None, "best": None, "candidates_count": 0})
-            continue
+        files.append(fp)
 
-        sent = None
-        for s in _extract_sentences(text):
-            if tgt_l in s.lower():
-                sent = s.strip()
-                break
+    loop = asyncio.get_running_loop()
 
-        if not sent:
-            results.append({"file": str(fp), "sentence": None, "best": None, "candidates_count": 0})
-            continue
+    if method == "wordnet":
+        pool = _get_wn_pool()
+        results = list(await asyncio.gather(
+            *[loop.run_in_executor(pool, _process_file_wordnet, str(fp), target) for fp in files]
+        ))
+    else:
+        sem = asyncio.Semaphore(_AQUAINT_CONCURRENCY)
+        # Candidates depend only on the target; fetch once for the batch.
+        wiki_candidates = await _fetch_wiki_candidates(target)
+
+        async def process_one(fp: Path) -> Dict[str, Any]:
+            sent = await loop.run_in_executor(None, _find_target_in_file, fp, tgt_l)
+            if not sent:
+                return {"file": str(fp), "sentence": None, "best": None, "candidates_count": 0}
+
+            async with sem:
+                out = _score_wiki_candidates(sent, target, wiki_candidates)
+
+            return {
+                "file": str(fp),
+                "sentence": sent,
+                "best": out.get("best_sense"),
+                "candidates_count": len(out.get("candidates", [])),
+            }
 
-        found += 1
-        if method == "wordnet":
-            out = compute_lesk_wordnet(sent, target)
-        else:
-            out = lesk_wikipedia(sent, target)
-
-        best = out.get("best_sense")
-        cands = out.get("candidates", [])
-        results.append({
-            "file": str(fp),
-            "sentence": sent,
-            "best": best,
-            "candidates_count": len(cands),
-        })
+        results = list(await asyncio.gather(*[process_one(fp) for fp in files]))
+
+    processed = len(files)
+    found = sum(1 for r in results if r["sentence"] is not None)
 
     run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ") + "-" + uuid.uuid4().hex[:8]
     out_dir = RUNS_DIR / "aquaint"
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"{run_id}.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "run_id": run_id,
-            "target": target,
-            "limit": limit,
-            "method": method,
-            "processed": processed,
-            "found_sentences": found,
-            "results": results,
-        }, f, ensure_ascii=False, indent=2)
+    payload = {
+        "run_id": run_id,
+        "target": target,
+        "limit": limit,
+        "method": method,
+        "processed": processed,
+        "found_sentences": found,
+        "results": results,
+    }
+    # orjson serializes multi-MB runs several times faster than json, and
+    # the write happens off the event loop.
+    data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    await loop.run_in_executor(None, out_path.write_bytes, data)
 
     return {
         "run_id": run_id,
@@ -373,7 +675,7 @@ async def aquaint_run(req: AquaintRunRequest):
     if not AQUAINT_DIR.exists():
         raise HTTPException(status_code=404, detail=f"AQUAINT_DIR not found: {AQUAINT_DIR}")
 
-    out = _run_aquaint_batch(req.target, req.limit, req.method)
+    out = await _run_aquaint_batch(req.target, req.limit, req.method)
     return AquaintRunResponse(**out)
 
 
@@ -383,9 +685,7 @@ async def aquaint_result(run_id: str):
     path = out_dir / f"{run_id}.json"
     if not path.exists():
         raise HTTPException(status_code=404, detail="run_id not found")
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data
+    return orjson.loads(path.read_bytes())
 
 
 
@@ -409,7 +709,7 @@ async def eval_correlation(req: CorrelationRequest):
         raise HTTPException(status_code=404, detail=f"Datasets dir not found: {datasets_dir}")
 
     try:
-        results = run_correlation_eval(datasets_dir, req.datasets)
+        results = await run_correlation_eval(datasets_dir, req.datasets)
         return {"results": results}
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
+import asyncio
 import csv
 import os
 
-from .utils import spearmanr
+from .utils import spearmanr, _rankdata
 from .wikisim_wrapper import batch_similarity
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 
 DATASETS = {
     "MC": "MC.csv",
@@ -80,11 +86,25 @@ def try_load_embeddings() -> Dict[str, object]:
 
     def load_if(path_env: str, label: str, binary: bool = False):
         p = os.getenv(path_env)
-        if p and Path(p).exists():
-            try:
-                models[label] = KeyedVectors.load_word2vec_format(p, binary=binary)
-            except Exception:
-                pass
+        if not (p and Path(p).exists()):
+            return
+        try:
+            # A native .kv copy alongside the source loads via mmap, so
+            # parallel workers share pages instead of each holding the
+            # full matrix in RAM.
+            native = Path(p + ".kv")
+            if native.exists():
+                kv = KeyedVectors.load(str(native), mmap="r")
+            else:
+                kv = KeyedVectors.load_word2vec_format(p, binary=binary)
+                try:
+                    kv.save(str(native))
+                except Exception:
+                    pass
+            kv._vocab_set = set(kv.key_to_index)
+            models[label] = kv
+        except Exception:
+            pass
 
     load_if("WORD2VEC_PATH", "word2vec", binary=True)
     load_if("GLOVE_PATH", "glove", binary=False)
@@ -92,6 +112,13 @@ def try_load_embeddings() -> Dict[str, object]:
     return models
 
 
+def _in_vocab(kv, word: str) -> bool:
+    vocab = getattr(kv, "_vocab_set", None)
+    if vocab is not None:
+        return word in vocab
+    return word in kv
+
+
 def _pairs(rows: List[Tuple[str, str, float]]) -> List[Tuple[str, str]]:
     return [(a, b) for a, b, _ in rows]
 
@@ -115,7 +142,7 @@ def eval_embedding(rows: List[Tuple[str, str, float]], kv) -> Optional[float]:
     sim: List[float] = []
     gold: List[float] = []
     for a, b, s in rows:
-        if a in kv and b in kv:
+        if _in_vocab(kv, a) and _in_vocab(kv, b):
             gold.append(s)
             sim.append(float(kv.similarity(a, b)))
     if not sim:
@@ -132,15 +159,34 @@ def sweep_convex_combo(rows: List[Tuple[str, str, float]], wikisim_scores: List[
     for (a, b), gt, ws in zip(pairs, human, wikisim_scores):
         if ws is None:
             continue
-        if a in kv and b in kv:
+        if _in_vocab(kv, a) and _in_vocab(kv, b):
             aligned.append((gt, ws, float(kv.similarity(a, b))))
 
     results: Dict[str, float] = {}
     if not aligned:
         return results
 
-    for k in range(0, 11):
-        alpha = k / 10.0
+    alphas = [k / 10.0 for k in range(0, 11)]
+
+    if np is not None:
+        # All 11 convex combinations in one matrix product, then rank and
+        # correlate each column against the gold ranks.
+        A = np.array(alphas)
+        M = np.stack([A, 1.0 - A], axis=1)               # 11 x 2
+        X = np.array([[ws, ft] for _, ws, ft in aligned])  # N x 2
+        combos = X @ M.T                                  # N x 11
+        rg = _rankdata(np.array([gt for gt, _, _ in aligned]))
+        rg -= rg.mean()
+        Rc = np.column_stack([_rankdata(combos[:, k]) for k in range(combos.shape[1])])
+        Rc -= Rc.mean(axis=0)
+        denom = np.sqrt((Rc * Rc).sum(axis=0) * (rg @ rg))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rhos = np.where(denom > 0, Rc.T @ rg / denom, np.nan)
+        for alpha, rho in zip(alphas, rhos):
+            results[f"alpha={alpha:.1f}"] = float(rho)
+        return results
+
+    for alpha in alphas:
         gold: List[float] = []
         combo: List[float] = []
         for gt, ws, ft in aligned:
@@ -151,22 +197,33 @@ def sweep_convex_combo(rows: List[Tuple[str, str, float]], wikisim_scores: List[
     return results
 
 
-def run_correlation_eval(data_dir: Path, datasets: List[str]) -> Dict[str, Dict[str, Optional[float]]]:
+async def run_correlation_eval(data_dir: Path, datasets: List[str]) -> Dict[str, Dict[str, Optional[float]]]:
     """Compute Spearman correlations for the requested datasets.
 
     Returns a nested dict: dataset -> method -> score or None
     Methods attempted: wikisim, word2vec, glove, fasttext
+
+    WikiSim lookups for all datasets run concurrently in the executor, so
+    multi-dataset requests cost one network-bound round instead of one
+    per dataset; embedding evals (pure CPU) also run off the event loop.
     """
     results: Dict[str, Dict[str, Optional[float]]] = {}
+    loop = asyncio.get_running_loop()
     embeddings = try_load_embeddings()
 
-    for name in datasets:
-        rows = load_dataset(data_dir, name)
+    rows_per_ds = [(name, load_dataset(data_dir, name)) for name in datasets]
+    sims_per_ds = await asyncio.gather(
+        *(loop.run_in_executor(None, batch_similarity, _pairs(rows)) for _, rows in rows_per_ds),
+        return_exceptions=True,
+    )
+
+    for (name, rows), sims in zip(rows_per_ds, sims_per_ds):
         out: Dict[str, Optional[float]] = {}
 
         # WikiSim
-        try:
-            sims = batch_similarity(_pairs(rows))
+        if isinstance(sims, BaseException):
+            out["wikisim"] = None
+        else:
             paired = [(gt, s) for gt, s in zip(_human(rows), sims) if s is not None]
             if paired:
                 gt, sv = zip(*paired)
@@ -174,13 +231,11 @@ def run_correlation_eval(data_dir: Path, datasets: List[str]) -> Dict[str, Dict[
                 out["wikisim"] = rho
             else:
                 out["wikisim"] = None
-        except Exception:
-            out["wikisim"] = None
 
         # Embeddings
         for label, kv in embeddings.items():
             try:
-                out[label] = eval_embedding(rows, kv)
+                out[label] = await loop.run_in_executor(None, eval_embedding, rows, kv)
             except Exception:
                 out[label] = None
 
@@ -1,28 +1,59 @@
 from typing import List, Tuple
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 
 def _rank(values: List[float]) -> List[float]:
-    indexed = sorted([(v, i) for i, v in enumerate(values)])
-    ranks = [0.0] * len(values)
+    n = len(values)
+    order = sorted(range(n), key=values.__getitem__)
+    ranks = [0.0] * n
     i = 0
-    while i < len(indexed):
+    while i < n:
         j = i
-        while j + 1 < len(indexed) and indexed[j + 1][0] == indexed[i][0]:
+        while j + 1 < n and values[order[j + 1]] == values[order[i]]:
             j += 1
-        avg_rank = (i + 1 + j + 1) / 2.0
+        avg_rank = (i + j + 2) / 2.0
         for k in range(i, j + 1):
-            ranks[indexed[k][1]] = avg_rank
+            ranks[order[k]] = avg_rank
         i = j + 1
     return ranks
 
 
+def _rankdata(x: "np.ndarray") -> "np.ndarray":
+    """Average-tie ranks (1-based) of a 1-D float array, vectorized."""
+    order = x.argsort()
+    ranks = np.empty(len(x), dtype=float)
+    ranks[order] = np.arange(1, len(x) + 1, dtype=float)
+    _, inverse, counts = np.unique(x, return_inverse=True, return_counts=True)
+    # Average the positional ranks within each tie group.
+    sums = np.zeros(len(counts), dtype=float)
+    np.add.at(sums, inverse, ranks)
+    return sums[inverse] / counts[inverse]
+
+
 def spearmanr(x: List[float], y: List[float]) -> Tuple[float, float]:
     """Return Spearman rank correlation rho and p-value (p-value as 0.0 placeholder).
 
-    Implemented without SciPy to avoid extra dependencies.
+    Uses NumPy when available (ranking and dot products run in C over
+    contiguous arrays); falls back to pure Python otherwise. SciPy is
+    avoided to keep dependencies light.
     """
     if len(x) != len(y) or len(x) == 0:
         return float("nan"), 0.0
+    if np is not None:
+        ax = np.asarray(x, dtype=float)
+        ay = np.asarray(y, dtype=float)
+        rx = _rankdata(ax)
+        ry = _rankdata(ay)
+        rx -= rx.mean()
+        ry -= ry.mean()
+        den = np.sqrt((rx @ rx) * (ry @ ry))
+        if den == 0:
+            return float("nan"), 0.0
+        return float(rx @ ry / den), 0.0
     rx = _rank(x)
     ry = _rank(y)
     n = float(len(x))
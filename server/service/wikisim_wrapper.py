@@ -1,27 +1,235 @@
 from typing import List, Tuple, Optional, Dict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import atexit
+import functools
+import hashlib
 import os
+import queue
+import math
+import selectors
+import shlex
+import statistics
 import subprocess
+import threading
+import time
+import unicodedata
 import json
+import logging
 import re
-print("[DEBUG] WIKISIM_CMD =", os.environ.get("WIKISIM_CMD"))
-try:
-    import requests 
-except Exception:
-    requests = None  
 
-try:
-    import wikipedia as wp  
-except Exception:
-    wp = None
+logger = logging.getLogger(__name__)
+
+
+# Optional dependencies resolve lazily at first use rather than at module
+# import: importing this module (e.g. just for WikiSimNotAvailable or in
+# tests) stays cheap, and each import is attempted exactly once thanks to
+# the cache — repeated failures do not re-run the import machinery.
+
+@functools.lru_cache(maxsize=None)
+def _import_requests():
+    try:
+        import requests
+        return requests
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_wikipedia():
+    try:
+        import wikipedia
+        return wikipedia
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_aiohttp():
+    try:
+        import aiohttp
+        return aiohttp
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_httpx():
+    try:
+        import httpx
+        return httpx
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy():
+    try:
+        import numpy
+        return numpy
+    except Exception:
+        return None
+
+
+def _build_session():
+    """Pooled HTTP client shared by all WikiSim/Wikipedia calls.
+
+    Prefers httpx with HTTP/2: many concurrent similarity requests then
+    multiplex over one TCP+TLS connection instead of serializing on
+    HTTP/1.1 connections. Falls back to a keep-alive requests.Session
+    (and to None when neither library is importable); both expose the
+    same .get/.post surface used here.
+    """
+    httpx = _import_httpx()
+    if httpx is not None:
+        try:
+            client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+                headers={"User-Agent": "wsd-backend/1.0"},
+                follow_redirects=True,
+            )
+            atexit.register(client.close)
+            return client
+        except Exception:
+            pass  # h2 extra not installed; fall through to requests
+    requests = _import_requests()
+    if requests is None:
+        return None
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Keep-alive pooling so repeated calls skip per-request TCP/TLS
+    # handshakes.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "wsd-backend/1.0"})
+    atexit.register(session.close)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """Build the shared HTTP client on first use (cached thereafter)."""
+    return _build_session()
 
 
 class WikiSimNotAvailable(Exception):
     pass
 
 
+_FLOAT_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+_float_search = _FLOAT_RE.search
+
+
+def _parse_score(text: Optional[str], _float=float, _isfinite=math.isfinite) -> Optional[float]:
+    """Extract the first finite float from a response/CLI output.
+
+    Trivially-numeric output (the common case: the backend prints just a
+    number) goes through float() directly, which is far cheaper than a
+    regex scan. Hot names are bound locally to skip global lookups in
+    the per-pair loop. Non-finite values ("nan"/"inf", which float()
+    accepts) are rejected so they can never enter the score caches and
+    poison downstream correlations.
+    """
+    if not text:
+        return None
+    stripped = text.strip()
+    if not stripped:
+        return None
+    try:
+        score = _float(stripped.split(None, 1)[0])
+        if _isfinite(score):
+            return score
+    except ValueError:
+        pass
+    m = _float_search(text)
+    if m:
+        score = _float(m.group(0))
+        if _isfinite(score):
+            return score
+    return None
+
+
+_WIKI_API = "https://en.wikipedia.org/w/api.php"
+
+# Titles resolved in bulk ahead of a batch; consulted by _wiki_title so
+# prefetched terms never trigger a per-term request.
+_BULK_TITLES: Dict[str, Optional[str]] = {}
+
+
+def _wiki_titles_bulk(terms: List[str]) -> Dict[str, Optional[str]]:
+    """Resolve many raw terms to canonical titles, 50 per HTTP request.
+
+    Uses action=query&redirects=1 with pipe-joined titles, so a batch of
+    N terms costs ceil(N/50) round-trips instead of up to 2 per term.
+    Terms without an exact page stay unresolved (None) and fall back to
+    the per-term search in _wiki_title.
+    """
+    out: Dict[str, Optional[str]] = {t: None for t in terms}
+    session = _get_session()
+    if session is None:
+        return out
+    terms = list(out)
+    for i in range(0, len(terms), 50):
+        chunk = terms[i:i + 50]
+        try:
+            resp = session.get(
+                _WIKI_API,
+                params={"action": "query", "redirects": 1, "titles": "|".join(chunk), "format": "json"},
+                timeout=10,
+            )
+            query = resp.json().get("query", {})
+        except Exception:
+            continue
+        renames: Dict[str, str] = {}
+        for mapping in query.get("normalized", []) + query.get("redirects", []):
+            renames[mapping.get("from", "")] = mapping.get("to", "")
+        valid = {p.get("title") for p in query.get("pages", {}).values() if "missing" not in p}
+        for t in chunk:
+            resolved = t
+            for _ in range(3):  # normalization then redirect, at most
+                if resolved not in renames:
+                    break
+                resolved = renames[resolved]
+            if resolved in valid:
+                title = resolved.replace(" ", "_")
+                out[t] = title
+                _BULK_TITLES[t] = title
+    return out
+
+
+@functools.lru_cache(maxsize=50_000)
 def _wiki_title(term: str) -> Optional[str]:
     """Map a raw word to a likely Wikipedia concept title.
+
+    Cached per process: WSD corpora repeat words heavily (Zipf), and the
+    lookup is pure, so repeats skip the network entirely. None results
+    are cached too so failing terms are not re-probed.
     """
+    if term in _BULK_TITLES:
+        return _BULK_TITLES[term]
+    session = _get_session()
+    if session is not None:
+        try:
+            resp = session.get(
+                _WIKI_API,
+                params={"action": "query", "list": "search", "srsearch": term, "srlimit": 1, "format": "json"},
+                timeout=10,
+            )
+            hits = resp.json().get("query", {}).get("search", [])
+            if hits:
+                return hits[0]["title"].replace(" ", "_")
+        except Exception:
+            pass
+    wp = _import_wikipedia()
     if wp is None:
         return None
     try:
@@ -38,92 +246,713 @@ def _wiki_title(term: str) -> Optional[str]:
     return None
 
 
+# Similarity is symmetric and pure w.r.t. the word pair, so scores are
+# memoized under a case-insensitive, order-independent key. Only real
+# scores live here — failures belong to _neg_pairs, whose TTL lets a
+# recovered backend be retried. Capped so a long-lived server cannot
+# grow it without bound.
+_PAIR_CACHE_CAP = 100_000
+_PAIR_CACHE: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+# Guards _PAIR_CACHE and the SIM-LRU structures below: OrderedDict
+# reordering is not safe under the concurrent executor threads that
+# batch_similarity runs on.
+_cache_lock = threading.Lock()
+
+
+def _pair_cache_put(key: Tuple[str, str], score: float) -> None:
+    with _cache_lock:
+        _PAIR_CACHE[key] = score
+        _PAIR_CACHE.move_to_end(key, last=False)  # insert-at-front
+        while len(_PAIR_CACHE) > _PAIR_CACHE_CAP:
+            _PAIR_CACHE.popitem(last=True)  # evict tail
+
+
+def _pair_cache_get(key: Tuple[str, str]) -> Optional[float]:
+    with _cache_lock:
+        score = _PAIR_CACHE.get(key)
+        if score is not None:
+            _PAIR_CACHE.move_to_end(key, last=False)  # move-to-front on hit
+        return score
+
+
+def _pair_key(w1: str, w2: str) -> Tuple[str, str]:
+    return tuple(sorted((w1.lower(), w2.lower())))
+
+
+@functools.lru_cache(maxsize=100_000)
+def _norm(s: str) -> str:
+    return unicodedata.normalize("NFKC", s).casefold().strip()
+
+
+class _TTLSet:
+    """Bounded set whose membership expires after ttl seconds.
+
+    Used for negative caching: a miss costs an O(1) lookup for the TTL
+    window instead of re-paying a full network timeout.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[object, float]" = OrderedDict()
+        # batch_similarity runs on concurrent executor threads, so
+        # expiry/insert must not race.
+        self._lock = threading.Lock()
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            expires = self._data.get(key)
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                self._data.pop(key, None)
+                return False
+            return True
+
+    def add(self, key) -> None:
+        with self._lock:
+            self._data[key] = time.monotonic() + self.ttl
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+# Pairs whose lookups just failed everywhere are skipped for a short
+# window so a flaky backend cannot serialize a whole batch behind
+# repeated timeouts.
+_neg_pairs = _TTLSet(maxsize=10_000, ttl=60)
+
+
+class _EndpointState:
+    """Circuit breaker + latency history for one WikiSim URL.
+
+    Closed while consecutive failures stay under the threshold; open for
+    a cooldown period afterwards; half-open (one probe allowed) once the
+    cooldown elapses. Success latencies drive an adaptive timeout so a
+    degraded endpoint fails fast instead of burning the full 10s.
+    """
+
+    __slots__ = ("latencies", "failures", "opened_at")
+
+    def __init__(self):
+        self.latencies: deque = deque(maxlen=64)
+        self.failures = 0
+        self.opened_at = 0.0
+
+
+_BREAKER_FAILURES = 5
+_BREAKER_COOLDOWN = 30.0
+_DEFAULT_TIMEOUT = 10.0
+_endpoint_states: Dict[str, _EndpointState] = {}
+_endpoint_lock = threading.Lock()
+
+
+def _endpoint_state(url: str) -> _EndpointState:
+    with _endpoint_lock:
+        return _endpoint_states.setdefault(url, _EndpointState())
+
+
+def _endpoint_available(url: str) -> bool:
+    st = _endpoint_state(url)
+    if st.failures < _BREAKER_FAILURES:
+        return True  # closed
+    return (time.monotonic() - st.opened_at) >= _BREAKER_COOLDOWN  # half-open probe
+
+
+def _endpoint_timeout(url: str) -> float:
+    st = _endpoint_state(url)
+    if len(st.latencies) >= 8:
+        p95 = statistics.quantiles(st.latencies, n=20)[18]
+        return max(p95 * 3, 1.5)
+    return _DEFAULT_TIMEOUT
+
+
+def _endpoint_success(url: str, elapsed: float) -> None:
+    st = _endpoint_state(url)
+    st.latencies.append(elapsed)
+    st.failures = 0
+
+
+def _endpoint_failure(url: str) -> None:
+    st = _endpoint_state(url)
+    st.failures += 1
+    if st.failures >= _BREAKER_FAILURES:
+        st.opened_at = time.monotonic()
+
+
+# Sentinel distinguishing "no trivial answer" from a legitimate None score.
+_MISS = object()
+
+
+def _trivial_similarity(w1: str, w2: str):
+    """Answer degenerate pairs without any I/O.
+
+    Empty/whitespace input can never score; identical words (after NFKC
+    casefolding) are maximally similar by definition.
+    """
+    n1, n2 = _norm(w1), _norm(w2)
+    if not n1 or not n2:
+        return None
+    if n1 == n2:
+        return 1.0
+    return _MISS
+
+
+# Approximate (SIM-LRU) cache: near-duplicate pairs such as ("car","auto")
+# vs ("cars","auto") miss the exact cache but land within a few bits of
+# each other under a character-trigram SimHash, so their cached score can
+# be reused instead of paying another round trip.
+_SIM_CACHE_CAP = 10_000
+# Total Hamming bits across both 64-bit sketches. Morphological variants
+# ("car"/"cars", "plant"/"plants") land around 12-14 bits apart while
+# unrelated short words sit above ~16, so 14 trades a few misses for no
+# observed false merges.
+_SIM_CACHE_MAX_DIST = 14
+_sim_cache: "OrderedDict[Tuple[int, int], float]" = OrderedDict()
+# Columnar view of the cache keys for the vectorized scan; rebuilt lazily
+# after inserts/evictions (recency reordering keeps it valid).
+_sim_cache_index = None
+
+
+@functools.lru_cache(maxsize=100_000)
+def _sketch(term: str) -> int:
+    """64-bit SimHash over boundary-padded character trigrams of a term."""
+    t = "^" + term.lower() + "$"
+    grams = {t[i:i + 3] for i in range(len(t) - 2)}
+    counts = [0] * 64
+    for g in grams:
+        h = int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            counts[bit] += 1 if (h >> bit) & 1 else -1
+    return sum(1 << bit for bit in range(64) if counts[bit] > 0)
+
+
+def _sketch_pair(key: Tuple[str, str]) -> Tuple[int, int]:
+    return _sketch(key[0]), _sketch(key[1])
+
+
+def _sim_cache_get(sk: Tuple[int, int]) -> Optional[float]:
+    np = _import_numpy()
+    with _cache_lock:
+        if not _sim_cache:
+            return None
+        if np is not None:
+            # XOR + popcount across all cached sketches in one C pass
+            # instead of a per-entry Python loop.
+            global _sim_cache_index
+            if _sim_cache_index is None:
+                keys = list(_sim_cache)
+                n = len(keys)
+                s1 = np.fromiter((k[0] for k in keys), dtype=np.uint64, count=n)
+                s2 = np.fromiter((k[1] for k in keys), dtype=np.uint64, count=n)
+                _sim_cache_index = (keys, s1, s2)
+            keys, s1, s2 = _sim_cache_index
+            dist = np.bitwise_count(s1 ^ np.uint64(sk[0])) + np.bitwise_count(s2 ^ np.uint64(sk[1]))
+            i = int(dist.argmin())
+            if int(dist[i]) > _SIM_CACHE_MAX_DIST:
+                return None
+            best_key = keys[i]
+            _sim_cache.move_to_end(best_key, last=False)  # move-to-front on hit
+            return _sim_cache[best_key]
+        best_key = None
+        best_dist = _SIM_CACHE_MAX_DIST + 1
+        for key in _sim_cache:
+            dist = (key[0] ^ sk[0]).bit_count() + (key[1] ^ sk[1]).bit_count()
+            if dist < best_dist:
+                best_key, best_dist = key, dist
+                if dist == 0:
+                    break
+        if best_key is None:
+            return None
+        _sim_cache.move_to_end(best_key, last=False)  # move-to-front on hit
+        return _sim_cache[best_key]
+
+
+def _sim_cache_put(sk: Tuple[int, int], score: float) -> None:
+    global _sim_cache_index
+    with _cache_lock:
+        _sim_cache[sk] = score
+        _sim_cache.move_to_end(sk, last=False)  # insert-at-front
+        while len(_sim_cache) > _SIM_CACHE_CAP:
+            _sim_cache.popitem(last=True)  # evict tail
+        _sim_cache_index = None
+
+
 def similarity_word_pair(w1: str, w2: str) -> Optional[float]:
     """Compute similarity via hosted WikiSim web API .
     """
-    t1 = _wiki_title(w1) or w1
-    t2 = _wiki_title(w2) or w2
+    trivial = _trivial_similarity(w1, w2)
+    if trivial is not _MISS:
+        return trivial
+    key = _pair_key(w1, w2)
+    cached = _pair_cache_get(key)
+    if cached is not None:
+        return cached
+    sk = _sketch_pair(key)
+    approx = _sim_cache_get(sk)
+    if approx is not None:
+        return approx
+    score = _similarity_word_pair_uncached(w1, w2)
+    if score is not None:
+        _pair_cache_put(key, score)
+        _sim_cache_put(sk, score)
+    return score
+
+
+# Shared by all _resolve_titles calls: spinning up (and joining) a fresh
+# executor per pair costs two thread startups even when both lookups are
+# cache hits.
+_title_executor: Optional[ThreadPoolExecutor] = None
+_title_executor_lock = threading.Lock()
+
+
+def _get_title_executor() -> ThreadPoolExecutor:
+    global _title_executor
+    if _title_executor is None:
+        with _title_executor_lock:
+            if _title_executor is None:
+                _title_executor = ThreadPoolExecutor(max_workers=8)
+                atexit.register(_title_executor.shutdown, wait=False)
+    return _title_executor
+
+
+def _resolve_titles(w1: str, w2: str) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve both titles at once; two independent lookups shouldn't chain."""
+    if w1 in _BULK_TITLES and w2 in _BULK_TITLES:
+        return _BULK_TITLES[w1], _BULK_TITLES[w2]
+    ex = _get_title_executor()
+    f1 = ex.submit(_wiki_title, w1)
+    f2 = ex.submit(_wiki_title, w2)
+    return f1.result(), f2.result()
+
+
+# Error pages can be verbose; the score is always near the front, so cap
+# how much body is buffered before giving up.
+_STREAM_BUF_LIMIT = 4096
+
+
+def _scan_stream_buf(buf: str, final: bool) -> Optional[float]:
+    """Parse a float from a partial body; a match flush against the end of
+    a non-final buffer is ignored since the next chunk could extend it."""
+    m = _float_search(buf)
+    if m and (final or m.end() < len(buf)):
+        return float(m.group(0))
+    return None
+
+
+def _post_sim_score(url: str, data: Dict[str, str], timeout: float) -> Optional[float]:
+    """POST a similarity query and read the body incrementally.
+
+    The backend prints a single number, so the read stops (and the
+    connection returns to the pool) as soon as a complete float is seen
+    rather than downloading and decoding the whole body. Connection-level
+    errors propagate to the caller's breaker handling.
+    """
+    session = _get_session()
+    httpx = _import_httpx()
+    if httpx is not None and isinstance(session, httpx.Client):
+        with session.stream("POST", url, data=data, timeout=timeout) as resp:
+            buf = ""
+            for chunk in resp.iter_text():
+                buf += chunk
+                score = _scan_stream_buf(buf, final=False)
+                if score is not None:
+                    return score
+                if len(buf) >= _STREAM_BUF_LIMIT:
+                    break
+            return _scan_stream_buf(buf, final=True)
+
+    with session.post(url, data=data, timeout=timeout, stream=True) as resp:
+        buf = ""
+        for chunk in resp.iter_content(chunk_size=256, decode_unicode=True):
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode("utf-8", "ignore")
+            buf += chunk
+            score = _scan_stream_buf(buf, final=False)
+            if score is not None:
+                return score
+            if len(buf) >= _STREAM_BUF_LIMIT:
+                break
+        return _scan_stream_buf(buf, final=True)
+
+
+def _similarity_word_pair_uncached(w1: str, w2: str) -> Optional[float]:
+    if _pair_key(w1, w2) in _neg_pairs:
+        return None
+
+    t1, t2 = _resolve_titles(w1, w2)
+    t1 = t1 or w1
+    t2 = t2 or w2
     candidates: List[Tuple[str, str]] = [(w1, w2)]
     if (t1, t2) != (w1, w2):
         candidates.append((t1, t2))
 
     web_urls = os.getenv("WIKISIM_WEB_SIM_URL")
-    if not (web_urls and requests is not None):
+    if not (web_urls and _get_session() is not None):
         return None
     urls = [u.strip() for u in web_urls.split(",") if u.strip()]
     for a, b in candidates:
         for url in urls:
+            if not _endpoint_available(url):
+                continue
+            started = time.monotonic()
             try:
-                resp = requests.post(url, data={"task": "sim", "dir": "1", "c1": a, "c2": b}, timeout=10)
-                text = (resp.text or "").strip()
-                m = re.search(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", text)
-                if m:
-                    return float(m.group(0))
+                score = _post_sim_score(
+                    url,
+                    {"task": "sim", "dir": "1", "c1": a, "c2": b},
+                    timeout=_endpoint_timeout(url),
+                )
+                _endpoint_success(url, time.monotonic() - started)
+                if score is not None:
+                    return score
             except Exception:
+                _endpoint_failure(url)
                 continue
+    _neg_pairs.add(_pair_key(w1, w2))
     return None
 
 
+def _probe_one(url: str) -> Dict[str, object]:
+    entry: Dict[str, object] = {"url": url, "ok": False}
+    try:
+        resp = _get_session().post(url, data={"task": "sim", "dir": "1", "c1": "United_States", "c2": "Canada"}, timeout=8)
+        if _parse_score(resp.text) is not None:
+            entry["ok"] = True
+        else:
+            entry["error"] = "no numeric in response"
+    except Exception as e:
+        entry["error"] = str(e)
+    return entry
+
+
 def wikisim_web_health() -> Dict[str, object]:
     """Check reachability of the configured WikiSim web endpoints.
+
+    Endpoints are probed in parallel so the check takes as long as the
+    slowest probe rather than the sum of all of them.
     """
     result: Dict[str, object] = {"ok": False, "endpoints": []}
     web_urls = os.getenv("WIKISIM_WEB_SIM_URL")
-    if not web_urls or requests is None:
+    if not web_urls or _get_session() is None:
         result["reason"] = "WIKISIM_WEB_SIM_URL not set or 'requests' missing"
         return result
     urls = [u.strip() for u in web_urls.split(",") if u.strip()]
-    any_ok = False
-    for url in urls:
-        entry: Dict[str, object] = {"url": url, "ok": False}
-        try:
-            resp = requests.post(url, data={"task": "sim", "dir": "1", "c1": "United_States", "c2": "Canada"}, timeout=8)
-            m = re.search(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", resp.text or "")
-            if m:
-                entry["ok"] = True
-                any_ok = True
-            else:
-                entry["error"] = "no numeric in response"
-        except Exception as e:
-            entry["error"] = str(e)
-        result["endpoints"].append(entry)
-    result["ok"] = any_ok
+    with ThreadPoolExecutor(max_workers=min(16, len(urls))) as ex:
+        entries = list(ex.map(_probe_one, urls))
+    result["endpoints"] = entries
+    result["ok"] = any(e["ok"] for e in entries)
     return result
 
 
 
 
+_WEB_CONCURRENCY = 16
+
+
+async def _sim_async(session, sem, loop, a: str, b: str, urls: List[str]) -> Optional[float]:
+    """Async twin of similarity_word_pair over a shared aiohttp session."""
+    trivial = _trivial_similarity(a, b)
+    if trivial is not _MISS:
+        return trivial
+    key = _pair_key(a, b)
+    cached = _pair_cache_get(key)
+    if cached is not None:
+        return cached
+    if key in _neg_pairs:
+        return None
+    sk = _sketch_pair(key)
+    approx = _sim_cache_get(sk)
+    if approx is not None:
+        return approx
+    t1, t2 = await asyncio.gather(
+        loop.run_in_executor(None, _wiki_title, a),
+        loop.run_in_executor(None, _wiki_title, b),
+    )
+    candidates: List[Tuple[str, str]] = [(a, b)]
+    if (t1 or a, t2 or b) != (a, b):
+        candidates.append((t1 or a, t2 or b))
+
+    async with sem:
+        for ca, cb in candidates:
+            for url in urls:
+                if not _endpoint_available(url):
+                    continue
+                started = time.monotonic()
+                try:
+                    async with session.post(
+                        url,
+                        data={"task": "sim", "dir": "1", "c1": ca, "c2": cb},
+                        timeout=_import_aiohttp().ClientTimeout(total=_endpoint_timeout(url)),
+                    ) as resp:
+                        text = await resp.text()
+                    _endpoint_success(url, time.monotonic() - started)
+                    score = _parse_score(text)
+                    if score is not None:
+                        _pair_cache_put(key, score)
+                        _sim_cache_put(sk, score)
+                        return score
+                except Exception:
+                    _endpoint_failure(url)
+                    continue
+    _neg_pairs.add(key)
+    return None
+
+
+def _batch_similarity_web_async(pairs: List[Tuple[str, str]], urls: List[str]) -> List[Optional[float]]:
+    """Resolve all pairs concurrently; N round-trips overlap instead of chaining."""
+
+    async def _run() -> List[Optional[float]]:
+        aiohttp = _import_aiohttp()
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(_WEB_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return list(await asyncio.gather(
+                *[_sim_async(session, sem, loop, a, b, urls) for a, b in pairs]
+            ))
+
+    return asyncio.run(_run())
+
+
+# Pool of long-lived WikiSim coprocesses: when WIKISIM_REPL_CMD points at
+# a REPL-capable driver (reads "a\tb" lines on stdin, prints one score per
+# line), fork/exec and interpreter warmup are paid once per pool slot
+# rather than once per pair. Pool size via WIKISIM_POOL_SIZE.
+_cli_pool: Optional["queue.Queue[subprocess.Popen]"] = None
+_cli_pool_lock = threading.Lock()
+
+
+def _spawn_repl_proc(repl_cmd: str) -> Optional[subprocess.Popen]:
+    try:
+        # Unbuffered binary pipes: the timed reader select()s on the raw
+        # fd, which only works when no data can hide in a Python-level
+        # buffer between calls.
+        return subprocess.Popen(
+            shlex.split(repl_cmd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+        )
+    except Exception:
+        return None
+
+
+def _shutdown_cli_pool() -> None:
+    global _cli_pool
+    pool = _cli_pool
+    _cli_pool = None
+    if pool is None:
+        return
+    while True:
+        try:
+            proc = pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+
+atexit.register(_shutdown_cli_pool)
+
+
+def _cli_pool_size() -> int:
+    try:
+        size = int(os.environ.get("WIKISIM_POOL_SIZE", "0"))
+    except ValueError:
+        size = 0
+    return size if size > 0 else min(4, os.cpu_count() or 1)
+
+
+def _get_cli_pool() -> Optional["queue.Queue[subprocess.Popen]"]:
+    global _cli_pool
+    repl_cmd = os.environ.get("WIKISIM_REPL_CMD")
+    if not repl_cmd:
+        return None
+    with _cli_pool_lock:
+        if _cli_pool is None:
+            pool: "queue.Queue[subprocess.Popen]" = queue.Queue()
+            for _ in range(_cli_pool_size()):
+                proc = _spawn_repl_proc(repl_cmd)
+                if proc is not None:
+                    pool.put(proc)
+            if pool.empty():
+                return None
+            _cli_pool = pool
+    return _cli_pool
+
+
+# Same deadline as the one-shot CLI path: a wedged worker must not block
+# its pool thread (and with it the whole batch) forever.
+_REPL_TIMEOUT = 10.0
+
+
+def _readline_deadline(proc: subprocess.Popen, timeout: float) -> bytes:
+    """Read one line from an unbuffered pipe, raising TimeoutError on expiry."""
+    deadline = time.monotonic() + timeout
+    fd = proc.stdout.fileno()
+    buf = bytearray()
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"no response within {timeout}s")
+            if not sel.select(remaining):
+                continue
+            chunk = os.read(fd, 4096)
+            if not chunk or b"\n" in chunk:  # EOF (worker died) or full line
+                buf += chunk
+                return bytes(buf)
+            buf += chunk
+
+
+def _repl_similarity(pool: "queue.Queue[subprocess.Popen]", a: str, b: str) -> Optional[float]:
+    proc = pool.get()
+    line = b""
+    try:
+        if proc.poll() is not None:
+            replacement = _spawn_repl_proc(os.environ.get("WIKISIM_REPL_CMD", ""))
+            if replacement is None:
+                raise RuntimeError("WikiSim REPL worker died and could not respawn")
+            proc = replacement
+        try:
+            proc.stdin.write(f"{a}\t{b}\n".encode("utf-8"))
+            proc.stdin.flush()
+            line = _readline_deadline(proc, _REPL_TIMEOUT)
+        except TimeoutError:
+            # The worker is wedged (or desynced); kill it and hand the
+            # pool a fresh one so later pairs aren't served stale lines.
+            logger.warning("WikiSim REPL timeout for %s, %s; respawning worker", a, b)
+            proc.kill()
+            replacement = _spawn_repl_proc(os.environ.get("WIKISIM_REPL_CMD", ""))
+            if replacement is not None:
+                proc = replacement
+    finally:
+        pool.put(proc)
+    return _parse_score_bytes(line)
+
+
 def batch_similarity(pairs: List[Tuple[str, str]]) -> List[Optional[float]]:
-    """Compute similarity using either WikiSim CLI (preferred) or web API."""
+    """Compute similarity using either WikiSim CLI (preferred) or web API.
+
+    Similarity is symmetric, so duplicate and swapped-duplicate pairs are
+    collapsed first, trivial pairs (empty or identical after folding) are
+    answered inline, and each remaining unique pair is resolved exactly
+    once before scattering the scores back to their original positions.
+    """
+    keys = [_pair_key(a, b) for a, b in pairs]
+    resolved: Dict[Tuple[str, str], Optional[float]] = {}
+    todo: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for (a, b), k in zip(pairs, keys):
+        if k in resolved or k in todo:
+            continue
+        trivial = _trivial_similarity(a, b)
+        if trivial is _MISS:
+            todo[k] = (a, b)
+        else:
+            resolved[k] = trivial
+    if todo:
+        resolved.update(zip(todo.keys(), _batch_similarity_dispatch(list(todo.values()))))
+    return [resolved[k] for k in keys]
+
+
+def _batch_similarity_dispatch(pairs: List[Tuple[str, str]]) -> List[Optional[float]]:
     scores: List[Optional[float]] = []
     wikisim_cmd = os.environ.get("WIKISIM_CMD")
 
-    print("[DEBUG] batch_similarity: using WIKISIM_CMD =", wikisim_cmd)
+    logger.debug("batch_similarity: using WIKISIM_CMD = %s", wikisim_cmd)
     if not wikisim_cmd:
         # fallback: web version
+        web_urls = os.getenv("WIKISIM_WEB_SIM_URL")
+        if web_urls and len(pairs) > 1:
+            # One bulk query per 50 terms seeds the title cache for the
+            # whole batch before any per-pair resolution starts.
+            _wiki_titles_bulk(sorted({w for pair in pairs for w in pair}))
+        if _import_aiohttp() is not None and web_urls and len(pairs) > 1:
+            # asyncio.run refuses to nest; probe for a running loop up
+            # front instead of catching RuntimeError, which would also
+            # swallow unrelated failures from inside the batch.
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                urls = [u.strip() for u in web_urls.split(",") if u.strip()]
+                return _batch_similarity_web_async(pairs, urls)
         for a, b in pairs:
             scores.append(similarity_word_pair(a, b))
         return scores
 
-    for a, b in pairs:
-        try:
-            # Run the CLI command
-            cmd = f'{wikisim_cmd} "{a}" "{b}"'
-            print("[DEBUG] Running:", cmd)
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=10
-            )
-            output = (result.stdout or "").strip()
-            # Try to parse float from CLI output
-            m = re.search(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", output)
-            if m:
-                scores.append(float(m.group(0)))
-            else:
-                scores.append(None)
-        except subprocess.TimeoutExpired:
-            print(f"[WARN] WikiSim timeout for {a}, {b}")
-            scores.append(None)
-        except Exception as e:
-            print(f"[ERROR] WikiSim failed for {a}, {b}: {e}")
-            scores.append(None)
-    return scores
+    cli_args = shlex.split(wikisim_cmd)
+    pool = _get_cli_pool()
+    if pool is not None:
+        def _one(p: Tuple[str, str]) -> Optional[float]:
+            try:
+                return _repl_similarity(pool, p[0], p[1])
+            except Exception as e:
+                logger.warning("WikiSim REPL failed (%s); falling back to one-shot CLI", e)
+                return _run_one_cli(cli_args, p[0], p[1])
+
+        workers = max(pool.qsize(), 1)
+        if len(pairs) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                return list(ex.map(_one, pairs))
+        return [_one(p) for p in pairs]
+
+    # One-shot invocations mostly wait on the child process, so overlap
+    # them across a small thread pool while keeping result order.
+    if len(pairs) > 1:
+        workers = min(len(pairs), (os.cpu_count() or 2) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(lambda p: _run_one_cli(cli_args, p[0], p[1]), pairs))
+    return [_run_one_cli(cli_args, a, b) for a, b in pairs]
+
+
+def _parse_score_bytes(buf: Optional[bytes]) -> Optional[float]:
+    """Parse the first finite float straight from raw stdout bytes.
+
+    float() accepts ASCII bytes directly, so the common case (the CLI
+    prints just a number) needs no decode at all; only the regex
+    fallback decodes, and then leniently. Non-finite values are rejected
+    just as in _parse_score.
+    """
+    if not buf:
+        return None
+    head = buf.split(None, 1)
+    if not head:
+        return None
+    try:
+        score = float(head[0])
+        if math.isfinite(score):
+            return score
+    except ValueError:
+        pass
+    m = _float_search(buf.decode("utf-8", "ignore"))
+    if m:
+        score = float(m.group(0))
+        if math.isfinite(score):
+            return score
+    return None
+
+
+def _run_one_cli(cli_args: List[str], a: str, b: str) -> Optional[float]:
+    """Run one WikiSim CLI invocation and parse a float from its stdout."""
+    try:
+        # Args are passed directly, so no /bin/sh fork and no quoting
+        # pitfalls. Output stays as bytes: skipping universal-newlines
+        # decoding of the whole stream is free throughput per call.
+        result = subprocess.run(
+            cli_args + [a, b], capture_output=True, timeout=10
+        )
+        return _parse_score_bytes(result.stdout)
+    except subprocess.TimeoutExpired:
+        logger.warning("WikiSim timeout for %s, %s", a, b)
+        return None
+    except Exception as e:
+        logger.error("WikiSim failed for %s, %s: %s", a, b, e)
+        return None